@@ -25,7 +25,7 @@ class GoogleTranslator(BaseTranslator):
             result = response.json()
             translation = result["data"]["translations"][0]["translatedText"]
 
-            logger.debug(f"  → {translation!r}")
+            logger.debug("  → {!r}", translation)
             return translation
         except Exception as e:
             logger.exception(f"Google Translator error [{target_code}] on {text!r}: {e}")
@@ -2,10 +2,14 @@ from loguru import logger
 from sqlalchemy import create_engine, text
 from datetime import datetime
 
+from app.logging import ProgressReporter
+from app.translation import TranslationTable
+
 class TranslationDBUpdater:
-    def __init__(self, db_url: str, translator) -> None:
+    def __init__(self, db_url: str, translator, batch_size: int = 16) -> None:
         self.engine = create_engine(db_url)
-        self.g_translator = translator  # Must expose .target_langs and translate_text
+        self.g_translator = translator  # Must expose .target_langs and translate_batch
+        self.batch_size = batch_size  # cells per translate_batch call
 
     def ensure_language_columns(self) -> None:
         """Ensure all language columns in target_langs exist in akilimo table."""
@@ -28,56 +32,85 @@ class TranslationDBUpdater:
             self.ensure_language_columns()
 
             result = conn.execute(text("SELECT * FROM akilimo"))
-            rows = result.mappings().all()
-            col_names = result.keys()
+            col_names = set(result.keys())
+            lang_codes = [code for code in self.g_translator.target_langs if code in col_names]
+            table = TranslationTable.from_mappings(result.mappings(), lang_codes)
 
             updated_count = 0
             skipped_count = 0
-
-            for row in rows:
-                lang_key = row["lang_key"]
-                en_text = row["en"]
-
-                if not en_text:
-                    logger.warning(f"[{lang_key}] has no English source, skipping.")
-                    continue
-
-                for lang_code, (lang_name, _) in self.g_translator.target_langs.items():
-                    if lang_code not in col_names:
-                        continue
-
-                    current_value = row.get(lang_code)
-
-                    # Check status table
-                    status = conn.execute(
-                        text("SELECT translated_at FROM akilimo_translation_status WHERE lang_key=:key AND lang_code=:code"),
-                        {"key": lang_key, "code": f"{lang_code}-skip"}
-                    ).fetchone()
-
-                    if status or current_value:
-                        skipped_count += 1
-                        logger.debug(f"[{lang_code}] {lang_key} already translated, skipping.")
-                        continue
-
-                    # Translate
-                    result_text = self.g_translator.translate_word(en_text, lang_code, lang_name, lang_key=lang_key)
-                    if not result_text:
-                        logger.error(f"[{lang_code}] {lang_key} ✗ failed")
-                        continue
-
-                    # Update akilimo table
-                    conn.execute(
-                        text(f"UPDATE akilimo SET {lang_code}=:val, updated_at=:ts WHERE lang_key=:key"),
-                        {"val": result_text, "ts": datetime.now(), "key": lang_key}
-                    )
-
-                    # Insert into status table
-                    # conn.execute(
-                    #     text("INSERT INTO akilimo_translation_status (lang_key, lang_code, translated_at) VALUES (:key, :code, :ts)"),
-                    #     {"key": lang_key, "code": lang_code, "ts": datetime.now()}
-                    # )
-
-                    updated_count += 1
-                    logger.success(f"[{lang_code}] {lang_key} ✓ {result_text!r}")
-
-            logger.info(f"Update complete: {updated_count} translations added, {skipped_count} skipped.")
\ No newline at end of file
+            filled_count = sum(len(table) - table.missing_count(code) for code in table.lang_codes)
+
+            no_source = [row.key for row in table if not row.source_text]
+            if no_source:
+                logger.warning("{} keys have no English source, skipping.", len(no_source))
+                logger.debug("Keys without English source: {}", no_source)
+
+            total = sum(table.missing_count(code) for code in table.lang_codes)
+            with ProgressReporter(total, "update_missing") as progress:
+                for lang_code in table.lang_codes:
+                    lang_name, _ = self.g_translator.target_langs[lang_code]
+
+                    pending: list[int] = []
+
+                    for idx in table.missing(lang_code):
+                        lang_key = table.key(idx)
+                        if not table.source_text(idx) or self.g_translator.is_array_key(lang_key):
+                            skipped_count += 1
+                            progress.advance(skipped=True)
+                            continue
+
+                        # Check status table
+                        status = conn.execute(
+                            text("SELECT translated_at FROM akilimo_translation_status WHERE lang_key=:key AND lang_code=:code"),
+                            {"key": lang_key, "code": f"{lang_code}-skip"}
+                        ).fetchone()
+
+                        if status:
+                            skipped_count += 1
+                            logger.debug("[{}] {} already translated, skipping.", lang_code, lang_key)
+                            progress.advance(skipped=True)
+                            continue
+
+                        pending.append(idx)
+
+                    for start in range(0, len(pending), self.batch_size):
+                        chunk = pending[start:start + self.batch_size]
+                        updated_count += self._translate_chunk(conn, table, chunk, lang_code, lang_name, progress)
+
+            logger.info(
+                f"Update complete: {updated_count} translations added, {skipped_count} skipped, "
+                f"{filled_count} already translated."
+            )
+
+    def _translate_chunk(self, conn, table: TranslationTable, chunk: list[int], lang_code: str, lang_name: str,
+                         progress: ProgressReporter) -> int:
+        """Translate one batch of cells and write the results back; returns the number stored."""
+        items = [(table.source_text(idx), table.key(idx)) for idx in chunk]
+        results = self.g_translator.translate_batch(items, lang_code, lang_name)
+
+        stored = 0
+        for idx, result_text in zip(chunk, results):
+            lang_key = table.key(idx)
+            if not result_text:
+                logger.error("[{}] {} ✗ failed", lang_code, lang_key)
+                progress.advance(ok=False)
+                continue
+
+            table.set(idx, lang_code, result_text)
+
+            # Update akilimo table
+            conn.execute(
+                text(f"UPDATE akilimo SET {lang_code}=:val, updated_at=:ts WHERE lang_key=:key"),
+                {"val": result_text, "ts": datetime.now(), "key": lang_key}
+            )
+
+            # Insert into status table
+            # conn.execute(
+            #     text("INSERT INTO akilimo_translation_status (lang_key, lang_code, translated_at) VALUES (:key, :code, :ts)"),
+            #     {"key": lang_key, "code": lang_code, "ts": datetime.now()}
+            # )
+
+            stored += 1
+            logger.debug("[{}] {} ✓ {!r}", lang_code, lang_key, result_text)
+            progress.advance()
+        return stored
@@ -4,7 +4,7 @@ import openpyxl
 from loguru import logger
 
 from app import SUPPORTED_LANGUAGES
-from app.translation import TranslationSource, TranslationRow
+from app.translation import TranslationSource, TranslationTable
 
 
 # ── XLSX backend ──────────────────────────────────────────────────────────────
@@ -20,7 +20,7 @@ class XlsxTranslationSource(TranslationSource):
     def describe(self) -> str:
         return f"Excel  {self.input_path} → {self.output_path}"
 
-    def load(self) -> list[TranslationRow]:
+    def load(self) -> TranslationTable:
         logger.info(f"Loading workbook: {self.input_path}")
         self._wb = openpyxl.load_workbook(self.input_path)
         self._sheet = self._wb.active
@@ -41,30 +41,23 @@ class XlsxTranslationSource(TranslationSource):
             else:
                 self._col_map[code] = col
 
-        rows: list[TranslationRow] = []
-        for row in self._sheet.iter_rows(min_row=2):
-            key = row[0].value
-            source_text = row[1].value
-            translations = {
-                code: (self._sheet.cell(row=row[0].row, column=col).value)
-                for code, col in self._col_map.items()
-            }
-            rows.append(TranslationRow(key=key, source_text=source_text, translations=translations))
+        table = TranslationTable(self._col_map.keys())
+        for row in self._sheet.iter_rows(min_row=2, values_only=True):
+            translations = {code: row[col - 1] for code, col in self._col_map.items()}
+            table.append(row[0], row[1], translations)
 
-        logger.info(f"Loaded {len(rows)} rows from sheet.")
-        return rows
+        logger.info(f"Loaded {len(table)} rows from sheet.")
+        return table
 
-    def save(self, rows: list[TranslationRow]) -> None:
+    def save(self, table: TranslationTable) -> None:
         for sheet_row in self._sheet.iter_rows(min_row=2):
-            key = sheet_row[0].value
-            match = next((r for r in rows if r.key == key), None)
-            if match is None:
+            idx = table.index_of(sheet_row[0].value)
+            if idx is None:
                 continue
             for code, col in self._col_map.items():
-                value = match.translations.get(code)
+                value = table.get(idx, code)
                 if value is not None:
-                    self._sheet.cell(row=sheet_row[0].row, column=col).value = value
+                    sheet_row[col - 1].value = value
 
         self._wb.save(self.output_path)
         logger.success(f"Workbook saved → {self.output_path}")
-
@@ -3,12 +3,14 @@ import torch
 from loguru import logger
 
 from app import TRANSLATION_OVERRIDES
+from app.length_budget import LengthBudget
 from app.translator import BaseTranslator
 
 
 class HuggingFaceTranslator(BaseTranslator):
     def __init__(self, source, target_langs, dry_run: bool) -> None:
         super().__init__(source, target_langs, dry_run)
+        self.length_budget = LengthBudget(namespace="huggingface")
         # Preload MarianMT models for Kinyarwanda and Swahili
         self.models = {
             "rw": {
@@ -31,16 +33,77 @@ class HuggingFaceTranslator(BaseTranslator):
         }
 
     def _call_model(self, text: str, target_code: str) -> str:
+        return self._call_model_batch([text], target_code)[0]
+
+    def _generate(self, tokenizer, model, texts: list[str], max_new_tokens: int) -> list[tuple[list[int], int, bool]]:
+        """
+        Greedy-decode texts and return (output tokens, source token count, truncated) per text.
+        A sequence is truncated when it used its whole budget without emitting EOS.
+        """
+        inputs = tokenizer(texts, return_tensors="pt", padding=True)
+        with torch.inference_mode():
+            outputs = model.generate(
+                **inputs,
+                max_new_tokens=max_new_tokens,
+                do_sample=False,
+                num_beams=1,
+            )
+
+        # Drop the decoder start token, or the echoed prompt for decoder-only models
+        offset = 1 if model.config.is_encoder_decoder else inputs["input_ids"].shape[1]
+        eos_id = model.generation_config.eos_token_id
+        eos_ids = set(eos_id) if isinstance(eos_id, list) else {eos_id}
+        pad_id = tokenizer.pad_token_id
+
+        results = []
+        for row, source_tokens in zip(outputs[:, offset:].tolist(), inputs["attention_mask"].sum(dim=1).tolist()):
+            eos_at = next((i for i, token in enumerate(row) if token in eos_ids), None)
+            if eos_at is not None:
+                results.append((row[:eos_at], source_tokens, False))
+                continue
+            while row and row[-1] == pad_id:
+                row.pop()
+            results.append((row, source_tokens, len(row) >= max_new_tokens))
+        return results
+
+    def _call_model_batch(self, texts: list[str], target_code: str) -> list[str]:
         try:
             tokenizer = self.models[target_code]["tokenizer"]
             model = self.models[target_code]["model"]
 
-            inputs = tokenizer([text], return_tensors="pt", padding=True)
-            outputs = model.generate(**inputs, max_length=200)
-            translation = tokenizer.decode(outputs[0], skip_special_tokens=True)
+            # Decoder-only models continue from the right edge, so pad on the left when batching
+            if not model.config.is_encoder_decoder:
+                tokenizer.padding_side = "left"
+
+            source_tokens = tokenizer(texts)["input_ids"]
+            budgets = [self.length_budget.budget(len(ids), target_code) for ids in source_tokens]
+            output_tokens: list[list[int]] = [[] for _ in texts]
+            pending = list(range(len(texts)))
+
+            while pending:
+                max_new_tokens = max(budgets[i] for i in pending)
+                results = self._generate(tokenizer, model, [texts[i] for i in pending], max_new_tokens)
+
+                retry = []
+                for i, (tokens, n_source, truncated) in zip(pending, results):
+                    output_tokens[i] = tokens
+                    self.length_budget.record(target_code, n_source, len(tokens), truncated=truncated)
+                    if not truncated:
+                        continue
+
+                    larger = self.length_budget.retry_budget(max_new_tokens)
+                    if larger is None:
+                        logger.warning(f"  [{target_code}] output still truncated at {max_new_tokens} tokens: {texts[i]!r}")
+                        continue
+                    logger.debug("  [{}] hit {}-token cap, retrying with {}", target_code, max_new_tokens, larger)
+                    budgets[i] = larger
+                    retry.append(i)
+                pending = retry
 
-            logger.debug(f"  → {translation!r}")
-            return translation
+            translations = tokenizer.batch_decode(output_tokens, skip_special_tokens=True)
+            for translation in translations:
+                logger.debug("  → {!r}", translation)
+            return translations
         except Exception as e:
-            logger.exception(f"HuggingFace error [{target_code}] on {text!r}: {e}")
-            return ""
+            logger.exception(f"HuggingFace error [{target_code}] on batch of {len(texts)}: {e}")
+            return [""] * len(texts)
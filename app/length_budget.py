@@ -0,0 +1,103 @@
+import atexit
+import json
+import math
+import os
+from pathlib import Path
+
+from loguru import logger
+
+from app import BASE_DIR
+
+DEFAULT_EXPANSION_RATIO = 1.5
+PRIOR_WEIGHT = 20  # source tokens' worth of confidence in the default ratio
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for backends that do not expose their tokenizer (~4 chars per token)."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+class LengthBudget:
+    """
+    Per-language output token budgets.
+    The budget for a request is the source token count scaled by an expansion ratio
+    learned from past translations, plus headroom. Observed output lengths are
+    persisted so the ratios improve across runs. Stats are kept per namespace
+    (backend/model) because token counts are only comparable within one tokenizer.
+    """
+
+    def __init__(
+            self,
+            namespace: str,
+            path: Path | None = None,
+            headroom: float = 1.5,
+            slack: int = 8,
+            max_tokens: int = 512,
+            save_every: int = 50,
+    ) -> None:
+        self.namespace = namespace
+        self.path = Path(path or os.getenv("LENGTH_STATS_PATH", BASE_DIR / "length_stats.json"))
+        self.headroom = headroom
+        self.slack = slack
+        self.max_tokens = max_tokens
+        self.save_every = save_every
+        self._stats: dict[str, dict[str, int]] = self._load()
+        self._unsaved = 0
+        atexit.register(self.save)
+
+    def _load(self) -> dict[str, dict[str, int]]:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable length stats {self.path}: {e}")
+            return {}
+
+    def save(self) -> None:
+        if not self._unsaved:
+            return
+        # Merge into what is on disk so other namespaces sharing the file are not overwritten
+        prefix = f"{self.namespace}:"
+        merged = self._load()
+        merged.update({key: stats for key, stats in self._stats.items() if key.startswith(prefix)})
+        try:
+            self.path.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+            self._unsaved = 0
+        except OSError as e:
+            logger.warning(f"Could not save length stats to {self.path}: {e}")
+
+    def _stats_key(self, lang_code: str) -> str:
+        return f"{self.namespace}:{lang_code}"
+
+    def ratio(self, lang_code: str) -> float:
+        stats = self._stats.get(self._stats_key(lang_code))
+        if not stats:
+            return DEFAULT_EXPANSION_RATIO
+        return (DEFAULT_EXPANSION_RATIO * PRIOR_WEIGHT + stats["output_tokens"]) / (PRIOR_WEIGHT + stats["source_tokens"])
+
+    def budget(self, source_tokens: int, lang_code: str) -> int:
+        budget = math.ceil(source_tokens * self.ratio(lang_code) * self.headroom) + self.slack
+        return min(budget, self.max_tokens)
+
+    def retry_budget(self, budget: int) -> int | None:
+        """Larger budget for a request that hit its cap, or None when already at the limit."""
+        if budget >= self.max_tokens:
+            return None
+        return min(budget * 2, self.max_tokens)
+
+    def record(self, lang_code: str, source_tokens: int, output_tokens: int, truncated: bool = False) -> None:
+        stats = self._stats.setdefault(
+            self._stats_key(lang_code), {"samples": 0, "source_tokens": 0, "output_tokens": 0, "truncated": 0}
+        )
+        if truncated:
+            # Truncated outputs understate the real length; count them but do not learn from them
+            stats["truncated"] += 1
+        else:
+            stats["samples"] += 1
+            stats["source_tokens"] += source_tokens
+            stats["output_tokens"] += output_tokens
+
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.save()
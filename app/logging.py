@@ -1,4 +1,5 @@
 import sys
+import time
 from datetime import datetime
 from loguru import logger
 
@@ -17,7 +18,7 @@ class LoggingConfig:
 
         # Console logger
         logger.add(
-            sys.stdout,
+            ProgressReporter.console_sink,
             colorize=True,
             level=level,
             format="<green>{time:HH:mm:ss}</green> | "
@@ -26,11 +27,12 @@ class LoggingConfig:
                    "{message}"
         )
 
-        # File logger
+        # File logger, written from a background thread so hot loops never wait on disk
         logger.add(
             f"{log_prefix}_{datetime.now().strftime('%Y%m%d')}.log",
             encoding="utf-8",
-            level="DEBUG",
+            level=level,
+            enqueue=True,
             format="{time:YYYY-MM-DD HH:mm:ss} | "
                    "{level:<8} | "
                    "{name}:{function}:{line} - {message}",
@@ -38,3 +40,104 @@ class LoggingConfig:
             retention="7 days",  # keep logs 7 days
             compression="zip"  # compress old logs
         )
+
+
+class ProgressReporter:
+    """
+    Aggregates per-item outcomes of a long loop into periodic INFO summaries and,
+    on a terminal, a single-line progress bar with throughput and ETA.
+    Use instead of logging a line per item:
+
+        with ProgressReporter(total, "translate") as progress:
+            for item in items:
+                ...
+                progress.advance(ok=bool(result))
+    """
+
+    _active: "ProgressReporter | None" = None
+
+    def __init__(self, total: int, label: str, summary_every: float = 30.0, width: int = 30) -> None:
+        self.total = total
+        self.label = label
+        self.summary_every = summary_every
+        self.width = width
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self._interactive = sys.stdout.isatty()
+        self._started_at = time.monotonic()
+        self._last_summary = self._started_at
+        self._last_draw = 0.0
+
+    def __enter__(self) -> "ProgressReporter":
+        ProgressReporter._active = self
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def done(self) -> int:
+        return self.succeeded + self.failed + self.skipped
+
+    def advance(self, ok: bool = True, skipped: bool = False, n: int = 1) -> None:
+        if skipped:
+            self.skipped += n
+        elif ok:
+            self.succeeded += n
+        else:
+            self.failed += n
+
+        now = time.monotonic()
+        if now - self._last_summary >= self.summary_every:
+            self._last_summary = now
+            logger.info("{}", self.summary())
+        elif self._interactive and now - self._last_draw >= 0.1:
+            self._draw()
+
+    def summary(self) -> str:
+        elapsed = time.monotonic() - self._started_at
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        percent = 100 * self.done / self.total if self.total else 100.0
+        eta = (self.total - self.done) / rate if rate > 0 else 0.0
+        return (
+            f"{self.label}: {self.done}/{self.total} ({percent:.1f}%) "
+            f"✓{self.succeeded} ✗{self.failed} ↷{self.skipped} | "
+            f"{rate:.1f}/s | elapsed {self._format_duration(elapsed)} | ETA {self._format_duration(eta)}"
+        )
+
+    def close(self) -> None:
+        if ProgressReporter._active is self:
+            ProgressReporter._active = None
+            self._clear()
+        logger.info("{}", self.summary())
+
+    # ── Terminal rendering ────────────────────────────────────────────────────
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours else f"{minutes}m{seconds:02d}s"
+
+    def _draw(self) -> None:
+        self._last_draw = time.monotonic()
+        filled = self.width * self.done // self.total if self.total else self.width
+        bar = "█" * filled + "·" * (self.width - filled)
+        sys.stdout.write(f"\r\x1b[K[{bar}] {self.summary()}")
+        sys.stdout.flush()
+
+    def _clear(self) -> None:
+        if self._interactive:
+            sys.stdout.write("\r\x1b[K")
+            sys.stdout.flush()
+
+    @classmethod
+    def console_sink(cls, message) -> None:
+        """Console sink that keeps an active progress bar below regular log lines."""
+        active = cls._active
+        if active is not None:
+            active._clear()
+        sys.stdout.write(message)
+        if active is not None and active._interactive:
+            active._draw()
+        sys.stdout.flush()
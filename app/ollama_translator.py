@@ -2,14 +2,19 @@ import ollama
 import json
 from loguru import logger
 
-from app import DEFAULT_PROMPT
+from app.length_budget import LengthBudget, estimate_tokens
 from app.translator import BaseTranslator
 
+# A blank line ends a single string resource, unless the source itself contains one
+STOP_SEQUENCES = ["\n\n"]
+
 
 class OllamaTranslator(BaseTranslator):
     def __init__(self, source, target_langs, prompt_template, dry_run: bool) -> None:
         super().__init__(source, target_langs, dry_run)
         self.prompt_template = prompt_template
+        # Source lengths here are estimate_tokens() guesses, so these ratios never mix with tokenizer counts
+        self.length_budget = LengthBudget(namespace="ollama:translategemma")
 
     def _build_prompt(self, text: str, target_code: str, target_lang: str) -> str:
         return self.prompt_template.format(
@@ -20,16 +25,42 @@ class OllamaTranslator(BaseTranslator):
             TEXT=text,
         )
 
-    def _call_model(self, target_code: str, source_text: str) -> str:
+    def _chat(self, prompt: str, num_predict: int, stop: list[str]) -> tuple[str, int, bool]:
+        response = ollama.chat(
+            model="translategemma",
+            messages=[{"role": "user", "content": prompt}],
+            stream=False,
+            options={"temperature": 0, "num_predict": num_predict, "stop": stop},
+        )
+        truncated = response.get("done_reason") == "length"
+        return response["message"]["content"].strip(), response.get("eval_count") or 0, truncated
+
+    def _call_model(self, text: str, target_code: str) -> str:
         try:
-            response = ollama.chat(
-                model="translategemma",
-                messages=[{"role": "user", "content": DEFAULT_PROMPT}],
-                stream=False,
-            )
-            translation = response["message"]["content"].strip()
-            logger.debug(f"  → {translation!r}")
+            target_lang, _ = self.target_langs[target_code]
+            prompt = self._build_prompt(text, target_code, target_lang)
+            if "{TEXT}" not in self.prompt_template:
+                prompt = f"{prompt}\n\n{text}"
+
+            stop = [] if "\n\n" in text else STOP_SEQUENCES
+            source_tokens = estimate_tokens(text)
+            num_predict = self.length_budget.budget(source_tokens, target_code)
+
+            while True:
+                translation, output_tokens, truncated = self._chat(prompt, num_predict, stop)
+                self.length_budget.record(target_code, source_tokens, output_tokens, truncated=truncated)
+                if not truncated:
+                    break
+
+                larger = self.length_budget.retry_budget(num_predict)
+                if larger is None:
+                    logger.warning(f"  [{target_code}] output still truncated at {num_predict} tokens: {text!r}")
+                    break
+                logger.debug("  [{}] hit {}-token cap, retrying with {}", target_code, num_predict, larger)
+                num_predict = larger
+
+            logger.debug("  → {!r}", translation)
             return translation
         except Exception as e:
-            logger.exception(f"  Ollama error [{target_code}] on {source_text!r}: {e}")
+            logger.exception(f"  Ollama error [{target_code}] on {text!r}: {e}")
             return ""
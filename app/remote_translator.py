@@ -0,0 +1,68 @@
+import requests
+from loguru import logger
+
+from app.translator import BaseTranslator
+
+
+class RemoteTranslator(BaseTranslator):
+    """
+    Sends translations to a running `serve` process, which keeps its models warm.
+    Override protection and array-key handling happen on the server.
+    """
+
+    def __init__(self, source, target_langs, dry_run: bool, server_url: str, timeout: float = 300.0) -> None:
+        super().__init__(source, target_langs, dry_run)
+        self.server_url = server_url.rstrip("/")
+        self.timeout = timeout
+
+    @staticmethod
+    def is_available(server_url: str, lang_codes, timeout: float = 1.0) -> bool:
+        """True when the server answers /health and serves every one of lang_codes."""
+        try:
+            response = requests.get(f"{server_url.rstrip('/')}/health", timeout=timeout)
+            response.raise_for_status()
+            served = set(response.json().get("languages", []))
+        except (requests.RequestException, ValueError):
+            return False
+
+        missing = set(lang_codes) - served
+        if missing:
+            logger.warning("Translation server at {} does not serve {}", server_url, sorted(missing))
+            return False
+        return True
+
+    def _post(self, items: list[tuple[str, str]], target_code: str) -> list[str]:
+        try:
+            response = requests.post(
+                f"{self.server_url}/translate",
+                json={
+                    "lang_code": target_code,
+                    "texts": [text for text, _ in items],
+                    "keys": [key for _, key in items],
+                },
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            result = response.json()
+            logger.debug("  server latency {} ms, queue depth {}", result["latency_ms"], result["queue_depth"])
+            return result["translations"]
+        except requests.HTTPError as e:
+            logger.error("Translation server rejected [{}] batch of {}: {}", target_code, len(items), e)
+            return [""] * len(items)
+        except Exception as e:
+            logger.exception(f"Translation server error [{target_code}] on batch of {len(items)}: {e}")
+            return [""] * len(items)
+
+    def _translate(self, text: str, target_code: str, target_lang: str, lang_key: str) -> str:
+        logger.debug("Translating to {} [{}] and key--> {}", target_lang, target_code, lang_key)
+
+        if self.dry_run:
+            return f"[DRY-RUN:{target_code}] {text}"
+
+        return self._post([(text, lang_key)], target_code)[0]
+
+    def translate_batch(self, items: list[tuple[str, str]], lang_code: str, lang_name: str) -> list[str]:
+        if self.dry_run:
+            return [f"[DRY-RUN:{lang_code}] {text}" for text, _ in items]
+
+        return self._post(items, lang_code)
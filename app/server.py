@@ -0,0 +1,265 @@
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from loguru import logger
+
+
+# ── Micro-batching ────────────────────────────────────────────────────────────
+@dataclass
+class PendingTranslation:
+    source_text: str
+    lang_key: str
+    lang_code: str
+    enqueued_at: float = field(default_factory=time.monotonic)
+    done: threading.Event = field(default_factory=threading.Event)
+    result: str = ""
+    cancelled: bool = False
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent translation requests into batches for one warm translator.
+    A batch is flushed when it reaches max_batch_size or when its oldest item has
+    waited max_wait_ms. A single worker thread owns the model, so backends never
+    see concurrent calls.
+    """
+
+    def __init__(self, translator, max_batch_size: int = 16, max_wait_ms: int = 20,
+                 latency_window: int = 1000) -> None:
+        self.translator = translator
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: deque[PendingTranslation] = deque()
+        self._cond = threading.Condition()
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._batches = 0
+        self._items = 0
+        self._running = False
+        self._worker: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._running = True
+        self._worker = threading.Thread(target=self._loop, name="micro-batcher", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+
+    def submit(self, items: list[tuple[str, str]], lang_code: str, timeout: float | None = None) -> list[str]:
+        """Queue (source_text, lang_key) pairs and block until all are translated."""
+        pending = [PendingTranslation(source_text=text, lang_key=key, lang_code=lang_code) for text, key in items]
+        with self._cond:
+            self._queue.extend(pending)
+            self._cond.notify_all()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for item in pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not item.done.wait(remaining):
+                self._cancel(pending)
+                raise TimeoutError(f"Translation of {item.lang_key!r} timed out")
+        return [item.result for item in pending]
+
+    def _cancel(self, pending: list[PendingTranslation]) -> None:
+        """Drop abandoned items that are still queued so the model never works on them."""
+        with self._cond:
+            for item in pending:
+                item.cancelled = True
+            self._queue = deque(item for item in self._queue if not item.cancelled)
+            self._cond.notify_all()
+
+    def _next_batch(self) -> list[PendingTranslation]:
+        """Block until a batch is due; returns [] only once the batcher is stopped."""
+        with self._cond:
+            while self._running:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._running:
+                    break
+
+                # The head can change while waiting (cancellation), so take its deadline each pass
+                while self._running and self._queue and len(self._queue) < self.max_batch_size:
+                    remaining = self._queue[0].enqueued_at + self.max_wait - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                # Every queued item may have been cancelled while we waited; wait for new work
+                if self._queue:
+                    size = min(self.max_batch_size, len(self._queue))
+                    return [self._queue.popleft() for _ in range(size)]
+            return []
+
+    def _loop(self) -> None:
+        while self._running:
+            batch = self._next_batch()
+            if batch:
+                self._process(batch)
+
+    def _process(self, batch: list[PendingTranslation]) -> None:
+        by_lang: dict[str, list[PendingTranslation]] = {}
+        for item in batch:
+            if item.cancelled:
+                continue
+            by_lang.setdefault(item.lang_code, []).append(item)
+
+        for lang_code, items in by_lang.items():
+            lang_name, _ = self.translator.target_langs[lang_code]
+            try:
+                results = self.translator.translate_batch(
+                    [(item.source_text, item.lang_key) for item in items], lang_code, lang_name
+                )
+            except Exception as e:
+                logger.exception(f"Batch translation failed [{lang_code}]: {e}")
+                results = [""] * len(items)
+
+            finished_at = time.monotonic()
+            for item, result in zip(items, results):
+                item.result = result
+                self._latencies.append(finished_at - item.enqueued_at)
+                item.done.set()
+
+        self._batches += 1
+        self._items += len(batch)
+        logger.debug("Flushed batch of {} ({} language(s)), {} queued", len(batch), len(by_lang), self.queue_depth)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict:
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 2)
+
+        return {
+            "queue_depth": self.queue_depth,
+            "batches": self._batches,
+            "items": self._items,
+            "avg_batch_size": round(self._items / self._batches, 2) if self._batches else 0.0,
+            "latency_ms": {
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "max": percentile(1.0),
+            },
+        }
+
+
+# ── HTTP/JSON API ─────────────────────────────────────────────────────────────
+def parse_translate_request(payload) -> tuple[str, list[str], list[str]]:
+    """Validate a /translate body and return (lang_code, texts, keys); raises ValueError."""
+    if not isinstance(payload, dict):
+        raise ValueError("body must be a JSON object")
+
+    lang_code = payload.get("lang_code")
+    if not isinstance(lang_code, str):
+        raise ValueError("'lang_code' must be a string")
+
+    texts = payload.get("texts")
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        raise ValueError("'texts' must be a list of strings")
+
+    keys = payload.get("keys")
+    if keys is None:
+        keys = [""] * len(texts)
+    elif not isinstance(keys, list) or not all(isinstance(k, str) for k in keys):
+        raise ValueError("'keys' must be a list of strings")
+    elif len(keys) != len(texts):
+        raise ValueError("'keys' must match 'texts' in length")
+
+    return lang_code, texts, keys
+
+
+class TranslationRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET  /health     → backend and languages served
+    GET  /stats      → queue depth, batch and latency statistics
+    POST /translate  → {"lang_code": "sw", "texts": [...], "keys": [...]}
+    """
+
+    server: "TranslationServer"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(200, {
+                "status": "ok",
+                "backend": type(self.server.batcher.translator).__name__,
+                "languages": list(self.server.batcher.translator.target_langs.keys()),
+            })
+        elif self.path == "/stats":
+            self._send_json(200, self.server.batcher.stats())
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/translate":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            lang_code, texts, keys = parse_translate_request(payload)
+        except ValueError as e:
+            self._send_json(400, {"error": f"Invalid request: {e}"})
+            return
+
+        if lang_code not in self.server.batcher.translator.target_langs:
+            self._send_json(400, {"error": f"Language not served: {lang_code}"})
+            return
+
+        started_at = time.monotonic()
+        try:
+            translations = self.server.batcher.submit(list(zip(texts, keys)), lang_code, self.server.request_timeout)
+        except TimeoutError as e:
+            self._send_json(504, {"error": str(e)})
+            return
+
+        self._send_json(200, {
+            "translations": translations,
+            "latency_ms": round((time.monotonic() - started_at) * 1000, 2),
+            "queue_depth": self.server.batcher.queue_depth,
+        })
+
+    def _send_json(self, status: int, body: dict) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("{} - {}", self.address_string(), format % args)
+
+
+class TranslationServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host: str, port: int, batcher: MicroBatcher, request_timeout: float = 300.0) -> None:
+        super().__init__((host, port), TranslationRequestHandler)
+        self.batcher = batcher
+        self.request_timeout = request_timeout
+
+    def serve(self) -> None:
+        self.batcher.start()
+        host, port = self.server_address[:2]
+        logger.info(f"Translation server listening on http://{host}:{port}")
+        try:
+            self.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down translation server.")
+        finally:
+            self.server_close()
+            self.batcher.stop()
@@ -5,6 +5,9 @@ import xml.etree.ElementTree as ET
 import re
 from xml.dom import minidom
 
+from app.logging import ProgressReporter
+from app.translation import TranslationTable
+
 
 class AndroidStringsExporter:
     def __init__(self, db_url: str, output_dir: str, base_xml_path: str) -> None:
@@ -53,42 +56,56 @@ class AndroidStringsExporter:
 
     def export(self) -> None:
         with self.engine.connect() as conn:
-            result = conn.execute(text("SELECT * FROM akilimo"))
-            rows = {row["lang_key"]: row for row in result.mappings().all()}
-
             languages = self.get_language_columns()
 
-            for lang_code in languages:
-                resources = ET.Element("resources")
-
-                for key in self.key_order:
-                    row = rows.get(key)
-                    if not row:
-                        logger.warning(f"[{lang_code}] {key} missing in DB, skipping.")
-                        continue
-
-                    value = row.get(lang_code)
-                    if not value:
-                        logger.warning(f"[{lang_code}] {key} missing translation, skipping.")
-                        continue
-
-                    if "[" in key and "]" in key:
-                        logger.debug(f"Skipping array-style key: {key}")
-                        continue
-
-                    string_elem = ET.SubElement(resources, "string", name=key)
-                    string_elem.text = self._sanitize_value(value)
-
-                folder_name = self.lang_dir_map.get(lang_code, f"values-{lang_code}")
-                lang_dir = os.path.join(self.output_dir, folder_name)
-                os.makedirs(lang_dir, exist_ok=True)
-                file_path = os.path.join(lang_dir, "strings.xml")
-
-                # Pretty-print XML and ensure newline at EOF
-                pretty_xml = self._prettify(resources)
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(pretty_xml)
-                    if not pretty_xml.endswith("\n"):
-                        f.write("\n")
-
-                logger.success(f"Exported {lang_code} translations to {file_path}")
+            result = conn.execute(text("SELECT * FROM akilimo"))
+            table = TranslationTable.from_mappings(result.mappings(), languages)
+
+            with ProgressReporter(len(languages) * len(self.key_order), "export") as progress:
+                for lang_code in languages:
+                    resources = ET.Element("resources")
+                    missing_in_db = 0
+                    missing_translation = 0
+
+                    for key in self.key_order:
+                        idx = table.index_of(key)
+                        if idx is None:
+                            missing_in_db += 1
+                            logger.debug("[{}] {} missing in DB, skipping.", lang_code, key)
+                            progress.advance(skipped=True)
+                            continue
+
+                        if table.is_missing(idx, lang_code):
+                            missing_translation += 1
+                            logger.debug("[{}] {} missing translation, skipping.", lang_code, key)
+                            progress.advance(skipped=True)
+                            continue
+
+                        if "[" in key and "]" in key:
+                            logger.debug("Skipping array-style key: {}", key)
+                            progress.advance(skipped=True)
+                            continue
+
+                        string_elem = ET.SubElement(resources, "string", name=key)
+                        string_elem.text = self._sanitize_value(table.get(idx, lang_code))
+                        progress.advance()
+
+                    if missing_in_db or missing_translation:
+                        logger.warning(
+                            "[{}] skipped {} keys missing in DB and {} missing translations.",
+                            lang_code, missing_in_db, missing_translation
+                        )
+
+                    folder_name = self.lang_dir_map.get(lang_code, f"values-{lang_code}")
+                    lang_dir = os.path.join(self.output_dir, folder_name)
+                    os.makedirs(lang_dir, exist_ok=True)
+                    file_path = os.path.join(lang_dir, "strings.xml")
+
+                    # Pretty-print XML and ensure newline at EOF
+                    pretty_xml = self._prettify(resources)
+                    with open(file_path, "w", encoding="utf-8") as f:
+                        f.write(pretty_xml)
+                        if not pretty_xml.endswith("\n"):
+                            f.write("\n")
+
+                    logger.success(f"Exported {lang_code} translations to {file_path}")
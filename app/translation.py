@@ -1,13 +1,168 @@
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Mapping
+
+
+def _is_missing(value) -> bool:
+    return value is None or value == ""
 
 
 # ── Data model ────────────────────────────────────────────────────────────────
-@dataclass
+class TranslationTable:
+    """
+    Columnar store for a translation catalog.
+    Keys are interned and indexed once, each language is a single column, and a
+    per-language bitmap marks the cells that still need translating.
+    """
+
+    __slots__ = ("lang_codes", "_keys", "_index", "_source", "_columns", "_missing")
+
+    def __init__(self, lang_codes: Iterable[str]) -> None:
+        self.lang_codes: tuple[str, ...] = tuple(lang_codes)
+        self._keys: list[str] = []
+        self._index: dict[str, int] = {}  # key → row index
+        self._source: list[str | None] = []
+        self._columns: dict[str, list[str | None]] = {code: [] for code in self.lang_codes}
+        self._missing: dict[str, bytearray] = {code: bytearray() for code in self.lang_codes}
+
+    @classmethod
+    def from_mappings(cls, mappings: Iterable[Mapping], lang_codes: Iterable[str],
+                      key_column: str = "lang_key", source_column: str = "en") -> "TranslationTable":
+        """Build a table from DB-style row mappings without keeping the mappings around."""
+        table = cls(lang_codes)
+        for mapping in mappings:
+            table.append(
+                mapping[key_column],
+                mapping[source_column],
+                {code: mapping.get(code) for code in table.lang_codes},
+            )
+        return table
+
+    def append(self, key: str, source_text: str | None, translations: Mapping[str, str | None] | None = None) -> int:
+        idx = len(self._keys)
+        if isinstance(key, str):
+            key = sys.intern(key)
+        self._keys.append(key)
+        self._index.setdefault(key, idx)
+        self._source.append(source_text)
+
+        if idx % 8 == 0:
+            for bitmap in self._missing.values():
+                bitmap.append(0)
+
+        translations = translations or {}
+        for code in self.lang_codes:
+            value = translations.get(code)
+            self._columns[code].append(value)
+            if _is_missing(value):
+                self._missing[code][idx >> 3] |= 1 << (idx & 7)
+        return idx
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator["TranslationRow"]:
+        return (TranslationRow(self, idx) for idx in range(len(self._keys)))
+
+    def __getitem__(self, idx: int) -> "TranslationRow":
+        if not 0 <= idx < len(self._keys):
+            raise IndexError(idx)
+        return TranslationRow(self, idx)
+
+    def index_of(self, key: str) -> int | None:
+        return self._index.get(key)
+
+    def key(self, idx: int) -> str:
+        return self._keys[idx]
+
+    def source_text(self, idx: int) -> str | None:
+        return self._source[idx]
+
+    def get(self, idx: int, lang_code: str) -> str | None:
+        return self._columns[lang_code][idx]
+
+    def set(self, idx: int, lang_code: str, value: str | None) -> None:
+        self._columns[lang_code][idx] = value
+        bitmap = self._missing[lang_code]
+        if _is_missing(value):
+            bitmap[idx >> 3] |= 1 << (idx & 7)
+        else:
+            bitmap[idx >> 3] &= ~(1 << (idx & 7)) & 0xFF
+
+    def is_missing(self, idx: int, lang_code: str) -> bool:
+        return bool(self._missing[lang_code][idx >> 3] & (1 << (idx & 7)))
+
+    def missing(self, lang_code: str) -> Iterator[int]:
+        """Yield row indices whose lang_code cell still needs translating."""
+        for byte_idx, byte in enumerate(self._missing[lang_code]):
+            if not byte:
+                continue
+            base = byte_idx << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield base + bit
+
+    def missing_count(self, lang_code: str) -> int:
+        return sum(byte.bit_count() for byte in self._missing[lang_code])
+
+
 class TranslationRow:
-    key: str
-    source_text: str
-    translations: dict[str, str | None]  # lang_code → existing value or None
+    """Lightweight view of one row in a TranslationTable."""
+
+    __slots__ = ("_table", "_idx")
+
+    def __init__(self, table: TranslationTable, idx: int) -> None:
+        self._table = table
+        self._idx = idx
+
+    @property
+    def index(self) -> int:
+        return self._idx
+
+    @property
+    def key(self) -> str:
+        return self._table.key(self._idx)
+
+    @property
+    def source_text(self) -> str | None:
+        return self._table.source_text(self._idx)
+
+    @property
+    def translations(self) -> "RowTranslations":
+        return RowTranslations(self._table, self._idx)
+
+    def __repr__(self) -> str:
+        return f"TranslationRow(key={self.key!r}, source_text={self.source_text!r}, translations={dict(self.translations)!r})"
+
+
+class RowTranslations(Mapping):
+    """
+    lang_code → value mapping backed by the table columns of one row.
+    Cells can be assigned but not deleted: every language always has a cell,
+    so clear one with `translations[code] = None`.
+    """
+
+    __slots__ = ("_table", "_idx")
+
+    def __init__(self, table: TranslationTable, idx: int) -> None:
+        self._table = table
+        self._idx = idx
+
+    def __getitem__(self, lang_code: str) -> str | None:
+        if lang_code not in self._table.lang_codes:
+            raise KeyError(lang_code)
+        return self._table.get(self._idx, lang_code)
+
+    def __setitem__(self, lang_code: str, value: str | None) -> None:
+        if lang_code not in self._table.lang_codes:
+            raise KeyError(lang_code)
+        self._table.set(self._idx, lang_code, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.lang_codes)
+
+    def __len__(self) -> int:
+        return len(self._table.lang_codes)
 
 
 # ── Source abstraction ────────────────────────────────────────────────────────
@@ -15,12 +170,12 @@ class TranslationSource(ABC):
     """Abstract base — implement to support any backend (xlsx, db, csv, …)."""
 
     @abstractmethod
-    def load(self) -> list[TranslationRow]:
+    def load(self) -> TranslationTable:
         """Read all rows from the source."""
         ...
 
     @abstractmethod
-    def save(self, rows: list[TranslationRow]) -> None:
+    def save(self, table: TranslationTable) -> None:
         """Persist translated rows back to the source."""
         ...
 
@@ -2,6 +2,7 @@ import re
 
 from loguru import logger
 from app import TRANSLATION_OVERRIDES
+from app.logging import ProgressReporter
 from rapidfuzz import fuzz, process
 
 
@@ -17,8 +18,15 @@ class BaseTranslator:
         """
         raise NotImplementedError("Subclasses must implement _call_model")
 
+    def _call_model_batch(self, texts: list[str], target_code: str) -> list[str]:
+        """
+        Translate several texts into the same language.
+        Backends that support batched generation should override this.
+        """
+        return [self._call_model(text, target_code) for text in texts]
+
     def _translate(self, text: str, target_code: str, target_lang: str, lang_key: str) -> str:
-        logger.debug(f"Translating to {target_lang} [{target_code}] and key--> {lang_key}")
+        logger.debug("Translating to {} [{}] and key--> {}", target_lang, target_code, lang_key)
 
         if self.dry_run:
             return f"[DRY-RUN:{target_code}] {text}"
@@ -92,30 +100,66 @@ class BaseTranslator:
         Public method for external callers (e.g., DB updater).
         """
         if self.is_array_key(lang_key):
-            logger.error(f"Skipping translation for array key: {lang_key}")
+            logger.debug("Skipping translation for array key: {}", lang_key)
             return ""
 
         return self._translate(source_text, lang_code, lang_name, lang_key)
 
-    def run(self) -> None:
-        rows = self.source.load()
-        for idx, row in enumerate(rows, start=1):
-            if not row.source_text:
-                logger.warning(f"Row {idx} [{row.key}]: empty source, skipping.")
+    def translate_batch(self, items: list[tuple[str, str]], lang_code: str, lang_name: str) -> list[str]:
+        """
+        Translate (source_text, lang_key) pairs into one language with a single model call.
+        Results keep the order of items; array keys and failures come back as "".
+        """
+        logger.debug("Translating batch of {} to {} [{}]", len(items), lang_name, lang_code)
+        results = [""] * len(items)
+        pending = []
+
+        for idx, (source_text, lang_key) in enumerate(items):
+            if self.is_array_key(lang_key):
+                logger.debug("Skipping translation for array key: {}", lang_key)
+                continue
+
+            if self.dry_run:
+                results[idx] = f"[DRY-RUN:{lang_code}] {source_text}"
                 continue
 
-            logger.info(f"Row {idx}/{len(rows)} [{row.key}]: {row.source_text!r}")
+            protected_text, placeholder_map = self._protect_overrides(source_text, lang_code)
+            pending.append((idx, protected_text, placeholder_map))
+
+        if not pending:
+            return results
+
+        raw_translations = self._call_model_batch([text for _, text, _ in pending], lang_code)
+        for (idx, _, placeholder_map), raw_translation in zip(pending, raw_translations):
+            results[idx] = self._restore_overrides(raw_translation, placeholder_map)
+
+        return results
 
-            for lang_code, (lang_name, _) in self.target_langs.items():
-                if row.translations.get(lang_code) is not None:
-                    logger.debug(f"  [{lang_code}] already filled, skipping.")
+    def run(self) -> None:
+        table = self.source.load()
+        lang_items = [(code, name) for code, (name, _) in self.target_langs.items() if code in table.lang_codes]
+        total = sum(table.missing_count(code) for code, _ in lang_items)
+
+        with ProgressReporter(total, "translate") as progress:
+            for row in table:
+                missing = [(code, name) for code, name in lang_items if table.is_missing(row.index, code)]
+                if not missing:
+                    continue
+
+                if not row.source_text:
+                    logger.warning("Row {} [{}]: empty source, skipping.", row.index + 1, row.key)
+                    progress.advance(skipped=True, n=len(missing))
                     continue
 
-                result = self._translate(row.source_text, lang_code, lang_name, lang_key=row.key)
-                if result:
-                    row.translations[lang_code] = result
-                    logger.success(f"  [{lang_code}] ✓ {result!r}")
-                else:
-                    logger.error(f"  [{lang_code}] ✗ failed or empty.")
+                logger.debug("Row {}/{} [{}]: {!r}", row.index + 1, len(table), row.key, row.source_text)
+
+                for lang_code, lang_name in missing:
+                    result = self._translate(row.source_text, lang_code, lang_name, lang_key=row.key)
+                    if result:
+                        table.set(row.index, lang_code, result)
+                        logger.debug("  [{}] ✓ {!r}", lang_code, result)
+                    else:
+                        logger.error("  [{}] ✗ failed or empty.", lang_code)
+                    progress.advance(ok=bool(result))
 
-        self.source.save(rows)
+        self.source.save(table)
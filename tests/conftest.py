@@ -0,0 +1,4 @@
+import os
+
+# app/__init__.py copies HF_TOKEN into os.environ, which fails when it is unset
+os.environ.setdefault("HF_TOKEN", "")
@@ -0,0 +1,56 @@
+import pytest
+
+from app.length_budget import DEFAULT_EXPANSION_RATIO, LengthBudget, estimate_tokens
+
+
+@pytest.fixture
+def stats_path(tmp_path):
+    return tmp_path / "length_stats.json"
+
+
+def test_budget_uses_default_ratio_with_headroom_and_slack(stats_path):
+    budget = LengthBudget("hf", path=stats_path, headroom=1.5, slack=8)
+
+    assert budget.ratio("sw") == DEFAULT_EXPANSION_RATIO
+    assert budget.budget(2, "sw") == 13  # ceil(2 * 1.5 * 1.5) + 8
+    assert budget.budget(10_000, "sw") == budget.max_tokens
+
+
+def test_retry_budget_doubles_until_max(stats_path):
+    budget = LengthBudget("hf", path=stats_path, max_tokens=100)
+
+    assert budget.retry_budget(20) == 40
+    assert budget.retry_budget(60) == 100
+    assert budget.retry_budget(100) is None
+
+
+def test_record_learns_ratio_but_ignores_truncated_outputs(stats_path):
+    budget = LengthBudget("hf", path=stats_path)
+    for _ in range(100):
+        budget.record("sw", 10, 12)
+    learned = budget.ratio("sw")
+
+    budget.record("sw", 10, 500, truncated=True)
+
+    assert 1.2 < learned < DEFAULT_EXPANSION_RATIO
+    assert budget.ratio("sw") == learned
+    assert budget.ratio("rw") == DEFAULT_EXPANSION_RATIO
+
+
+def test_namespaces_share_a_file_without_mixing(stats_path):
+    hf = LengthBudget("hf", path=stats_path)
+    ollama = LengthBudget("ollama", path=stats_path)
+    hf.record("sw", 10, 10)
+    ollama.record("sw", 10, 30)
+    hf.save()
+    ollama.save()
+
+    assert LengthBudget("hf", path=stats_path).ratio("sw") == hf.ratio("sw")
+    assert LengthBudget("ollama", path=stats_path).ratio("sw") == ollama.ratio("sw")
+    assert hf.ratio("sw") != ollama.ratio("sw")
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("OK") == 1
+    assert estimate_tokens("x" * 9) == 3
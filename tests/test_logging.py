@@ -0,0 +1,100 @@
+import pytest
+from loguru import logger
+
+from app.logging import ProgressReporter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr("app.logging.time.monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def messages():
+    captured: list[str] = []
+    handler_id = logger.add(lambda message: captured.append(message.record["message"]), level="INFO")
+    yield captured
+    logger.remove(handler_id)
+
+
+def test_summary_reports_counts_rate_and_eta(clock):
+    progress = ProgressReporter(100, "translate", summary_every=1e9)
+    progress.advance(n=20)
+    progress.advance(ok=False, n=5)
+    progress.advance(skipped=True, n=15)
+    clock.now += 20
+
+    assert progress.done == 40
+    assert progress.summary() == (
+        "translate: 40/100 (40.0%) ✓20 ✗5 ↷15 | 2.0/s | elapsed 0m20s | ETA 0m30s"
+    )
+
+
+def test_summary_with_zero_total(clock):
+    progress = ProgressReporter(0, "export")
+
+    assert progress.summary() == "export: 0/0 (100.0%) ✓0 ✗0 ↷0 | 0.0/s | elapsed 0m00s | ETA 0m00s"
+
+
+@pytest.mark.parametrize("seconds, expected", [
+    (0, "0m00s"),
+    (59.9, "0m59s"),
+    (61, "1m01s"),
+    (3725, "1h02m05s"),
+    (36_000, "10h00m00s"),
+])
+def test_format_duration(seconds, expected):
+    assert ProgressReporter._format_duration(seconds) == expected
+
+
+def test_periodic_summary_is_logged_once_interval_elapses(clock, messages):
+    progress = ProgressReporter(10, "run", summary_every=30.0)
+    progress.advance()
+    assert messages == []
+
+    clock.now += 30
+    progress.advance()
+    assert len(messages) == 1
+    assert messages[0].startswith("run: 2/10 (20.0%)")
+
+
+def test_close_resets_active_and_logs_final_summary(clock, messages):
+    with ProgressReporter(3, "run", summary_every=1e9) as progress:
+        assert ProgressReporter._active is progress
+        progress.advance(n=3)
+
+    assert ProgressReporter._active is None
+    assert messages[-1].startswith("run: 3/3 (100.0%) ✓3")
+
+
+def test_console_sink_clears_and_redraws_active_bar(clock, capsys):
+    progress = ProgressReporter(4, "run", summary_every=1e9, width=4)
+    progress._interactive = True
+    progress.advance(n=2)
+    capsys.readouterr()
+
+    clear = "\r\x1b[K"
+    with progress:
+        ProgressReporter.console_sink("hello\n")
+        assert capsys.readouterr().out.startswith(clear + "hello\n" + clear + "[██··] run: 2/4")
+
+    # close() wipes the bar, after which log lines are written untouched
+    assert capsys.readouterr().out == clear
+    ProgressReporter.console_sink("after\n")
+    assert capsys.readouterr().out == "after\n"
+
+
+def test_console_sink_without_terminal_writes_plain_lines(clock, capsys):
+    with ProgressReporter(4, "run", summary_every=1e9):
+        ProgressReporter.console_sink("line\n")
+        assert capsys.readouterr().out == "line\n"
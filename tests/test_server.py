@@ -0,0 +1,189 @@
+import threading
+import time
+
+import pytest
+
+from app.server import MicroBatcher, parse_translate_request
+from app.translator import BaseTranslator
+
+
+class RecordingTranslator(BaseTranslator):
+    def __init__(self, target_langs=None, delay: float = 0.0) -> None:
+        super().__init__(None, target_langs or {"sw": ("Swahili", "Kiswahili")}, dry_run=False)
+        self.delay = delay
+        self.batches: list[list[str]] = []
+
+    def _call_model_batch(self, texts: list[str], target_code: str) -> list[str]:
+        self.batches.append(list(texts))
+        time.sleep(self.delay)
+        return [f"{target_code}:{text}" for text in texts]
+
+
+@pytest.fixture
+def batcher_factory():
+    started = []
+
+    def make(translator, **kwargs) -> MicroBatcher:
+        batcher = MicroBatcher(translator, **kwargs)
+        batcher.start()
+        started.append(batcher)
+        return batcher
+
+    yield make
+    for batcher in started:
+        batcher.stop()
+
+
+# ── Request validation ────────────────────────────────────────────────────────
+def test_parse_translate_request_defaults_keys():
+    assert parse_translate_request({"lang_code": "sw", "texts": ["a", "b"]}) == ("sw", ["a", "b"], ["", ""])
+
+
+@pytest.mark.parametrize("payload", [
+    [1, 2],
+    {"texts": ["a"]},
+    {"lang_code": "sw", "texts": 5},
+    {"lang_code": "sw", "texts": "abc"},
+    {"lang_code": "sw", "texts": ["a", 1]},
+    {"lang_code": "sw", "texts": ["a"], "keys": "k"},
+    {"lang_code": "sw", "texts": ["a"], "keys": ["k", "l"]},
+])
+def test_parse_translate_request_rejects_malformed(payload):
+    with pytest.raises(ValueError):
+        parse_translate_request(payload)
+
+
+# ── Micro-batching ────────────────────────────────────────────────────────────
+def test_flushes_when_batch_is_full(batcher_factory):
+    translator = RecordingTranslator()
+    batcher = batcher_factory(translator, max_batch_size=4, max_wait_ms=10_000)
+
+    results = batcher.submit([(f"t{i}", f"k{i}") for i in range(8)], "sw", timeout=5)
+
+    assert results == [f"sw:t{i}" for i in range(8)]
+    assert [len(batch) for batch in translator.batches] == [4, 4]
+
+
+def test_flushes_partial_batch_after_deadline(batcher_factory):
+    translator = RecordingTranslator()
+    batcher = batcher_factory(translator, max_batch_size=16, max_wait_ms=50)
+
+    started_at = time.monotonic()
+    assert batcher.submit([("hello", "k")], "sw", timeout=5) == ["sw:hello"]
+
+    assert 0.04 <= time.monotonic() - started_at < 2
+    assert translator.batches == [["hello"]]
+
+
+def test_coalesces_concurrent_submits(batcher_factory):
+    translator = RecordingTranslator()
+    batcher = batcher_factory(translator, max_batch_size=8, max_wait_ms=200)
+
+    threads = [threading.Thread(target=batcher.submit, args=([(f"t{i}", "")], "sw", 5)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [len(batch) for batch in translator.batches] == [8]
+    assert batcher.stats()["items"] == 8
+
+
+def test_uses_translator_languages(batcher_factory):
+    translator = RecordingTranslator(target_langs={"xx": ("Test", "Test")})
+    batcher = batcher_factory(translator, max_batch_size=1, max_wait_ms=0)
+
+    assert batcher.submit([("a", "")], "xx", timeout=5) == ["xx:a"]
+
+
+def test_timed_out_items_are_dropped_from_queue(batcher_factory):
+    translator = RecordingTranslator(delay=0.3)
+    batcher = batcher_factory(translator, max_batch_size=1, max_wait_ms=0)
+
+    blocker = threading.Thread(target=batcher.submit, args=([("first", "")], "sw", 5))
+    blocker.start()
+    time.sleep(0.05)  # let the worker pick up "first"
+
+    with pytest.raises(TimeoutError):
+        batcher.submit([("abandoned", "")], "sw", timeout=0.05)
+    assert batcher.queue_depth == 0
+
+    blocker.join()
+    time.sleep(0.1)
+    assert translator.batches == [["first"]]
+
+
+def test_remote_requires_every_language_to_be_served():
+    from app.remote_translator import RemoteTranslator
+    from app.server import TranslationServer
+
+    server = TranslationServer("127.0.0.1", 0, MicroBatcher(RecordingTranslator()))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        assert RemoteTranslator.is_available(url, ["sw"])
+        assert not RemoteTranslator.is_available(url, ["sw", "rw"])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_worker_survives_queue_emptied_by_timeout(batcher_factory):
+    translator = RecordingTranslator()
+    # The deadline is far away, so the worker is still waiting on it when the first submit gives up
+    batcher = batcher_factory(translator, max_batch_size=2, max_wait_ms=60_000)
+
+    with pytest.raises(TimeoutError):
+        batcher.submit([("abandoned", "")], "sw", timeout=0.05)
+    assert batcher.queue_depth == 0
+
+    # A full batch flushes on size, without waiting for the deadline
+    assert batcher.submit([("a", ""), ("b", "")], "sw", timeout=5) == ["sw:a", "sw:b"]
+    assert batcher._worker.is_alive()
+    assert translator.batches == [["a", "b"]]
+
+
+def test_next_batch_waits_again_when_every_queued_item_is_cancelled():
+    from app.server import PendingTranslation
+
+    batcher = MicroBatcher(RecordingTranslator(), max_batch_size=4, max_wait_ms=60_000)
+    batcher._running = True
+    abandoned = PendingTranslation(source_text="abandoned", lang_key="", lang_code="sw")
+    batcher._queue.append(abandoned)
+
+    returned = []
+    worker = threading.Thread(target=lambda: returned.append(batcher._next_batch()), daemon=True)
+    worker.start()
+
+    # Cancelling empties the queue and wakes the worker mid-wait; it must not hand back an empty batch
+    batcher._cancel([abandoned])
+    assert not returned
+
+    # An overdue item is flushed immediately
+    overdue = PendingTranslation(source_text="overdue", lang_key="", lang_code="sw", enqueued_at=time.monotonic() - 120)
+    with batcher._cond:
+        batcher._queue.append(overdue)
+        batcher._cond.notify_all()
+    worker.join(timeout=5)
+
+    assert returned == [[overdue]]
+
+
+def test_translate_rejects_language_the_backend_does_not_serve(batcher_factory):
+    import requests
+
+    from app.server import TranslationServer
+
+    batcher = batcher_factory(RecordingTranslator(), max_batch_size=1, max_wait_ms=0)
+    server = TranslationServer("127.0.0.1", 0, batcher)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        assert requests.get(f"{url}/health").json()["languages"] == ["sw"]
+        assert requests.post(f"{url}/translate", json={"lang_code": "fr", "texts": ["a"]}).status_code == 400
+        assert requests.post(f"{url}/translate", json={"lang_code": "sw", "texts": ["a"]}).json()["translations"] == ["sw:a"]
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,86 @@
+import sys
+
+import pytest
+
+from app.translation import TranslationTable
+
+
+def make_table(n: int) -> TranslationTable:
+    table = TranslationTable(["sw", "rw"])
+    for i in range(n):
+        table.append(f"key_{i}", f"text {i}", {"sw": f"sw {i}" if i % 3 == 0 else None, "rw": ""})
+    return table
+
+
+@pytest.mark.parametrize("n", [0, 1, 7, 8, 9, 17, 64])
+def test_missing_matches_column_values_across_byte_boundaries(n):
+    table = make_table(n)
+
+    expected = [i for i in range(n) if i % 3 != 0]
+    assert list(table.missing("sw")) == expected
+    assert table.missing_count("sw") == len(expected)
+    assert list(table.missing("rw")) == list(range(n))
+    assert table.missing_count("rw") == n
+
+
+def test_set_toggles_missing_bit_without_touching_neighbours():
+    table = make_table(17)
+
+    table.set(8, "sw", "filled")
+    assert not table.is_missing(8, "sw")
+    assert table.is_missing(7, "sw") and table.is_missing(10, "sw")
+
+    table.set(9, "sw", "")
+    assert table.is_missing(9, "sw")
+    assert list(table.missing("sw")) == [1, 2, 4, 5, 7, 9, 10, 11, 13, 14, 16]
+
+    table.set(0, "sw", None)
+    assert table.missing_count("sw") == 12
+
+
+def test_row_view_reads_and_writes_through_to_columns():
+    table = make_table(3)
+    row = table[1]
+
+    row.translations["rw"] = "muraho"
+    assert table.get(1, "rw") == "muraho"
+    assert not table.is_missing(1, "rw")
+    assert dict(row.translations) == {"sw": None, "rw": "muraho"}
+    assert not hasattr(row, "__dict__")
+
+    with pytest.raises(KeyError):
+        row.translations["fr"] = "bonjour"
+
+
+def test_keys_are_interned_and_indexed():
+    table = make_table(3)
+    key = "".join(["key_", "2"])
+
+    assert table.index_of(key) == 2
+    assert table.key(2) is sys.intern(key)
+    assert table.index_of("unknown") is None
+
+
+def test_from_mappings_keeps_only_requested_languages():
+    table = TranslationTable.from_mappings(
+        [{"lang_key": "a", "en": "A", "sw": "x", "fr": "y"}, {"lang_key": "b", "en": "B", "sw": None}],
+        ["sw"],
+    )
+
+    assert table.lang_codes == ("sw",)
+    assert list(table.missing("sw")) == [1]
+    assert table.source_text(0) == "A"
+
+
+def test_row_translations_cannot_drop_languages():
+    table = make_table(2)
+    translations = table[0].translations
+
+    translations["sw"] = None
+    assert table.is_missing(0, "sw")
+    assert "sw" in translations
+
+    for method in ("clear", "pop", "popitem", "update"):
+        assert not hasattr(translations, method)
+    with pytest.raises((TypeError, AttributeError)):
+        del translations["sw"]